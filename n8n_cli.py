@@ -2,7 +2,8 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
-#     "httpx>=0.27.0",
+#     "httpx[http2]>=0.27.0",
+#     "orjson>=3.10",
 # ]
 # ///
 """
@@ -33,6 +34,9 @@ Usage:
     uv run n8n-cli node <workflow_id> "HTTP Request" --set-param url="https://example.com"
     uv run n8n-cli node <workflow_id> "Agent" --set-param-json '{"options": {"systemMessage": "Hello"}}'
 
+    # Edit parameters on several nodes with a single update
+    uv run n8n-cli batch <workflow_id> edits.json
+
     # Create a new node
     uv run n8n-cli node <workflow_id> --add --type code --name "My Code Node"
     uv run n8n-cli node <workflow_id> --add --type switch --name "My Switch" --position 400,300
@@ -67,16 +71,21 @@ Usage:
     uv run n8n-cli retry <id>
 """
 
+from __future__ import annotations
+
 import argparse
-import json
+import functools
 import os
 import re
 import sys
 import uuid
-from datetime import datetime
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
 
-from n8n_client import N8nClient
+if TYPE_CHECKING:
+    # Imported lazily in main() so --help and usage errors skip loading httpx
+    from n8n_client import N8nClient
 
 
 NODE_TYPE_SHORTCUTS = {
@@ -97,19 +106,107 @@ SWITCH_OPERATORS = {
     "regex": {"type": "string", "operation": "regex"},
 }
 
+EXECUTION_STATUSES = ("canceled", "error", "running", "success", "waiting")
+
+# Keys allowed in each entry of a batch script
+BATCH_EDIT_KEYS = frozenset({'node', 'set', 'merge'})
+
+# Switch rules with these output keys catch unmatched items and must stay last
+FALLBACK_OUTPUT_KEYS = frozenset({'fallback', 'Fallback'})
+
+# Output above this size bypasses Python's stdout buffering
+LARGE_OUTPUT_BYTES = 64 * 1024
+
+# Runs of underscores or characters unsafe in filenames, collapsed to one underscore
+UNSAFE_FILENAME_CHARS = re.compile(r'(?:[^\w\-]|_)+')
+
 
 def format_time(iso_string: str | None) -> str:
     if not iso_string:
         return "-"
+    # API timestamps look like 2024-01-02T03:04:05.678Z; the output is just their date and time fields
+    if (
+        len(iso_string) >= 19
+        and iso_string[4] == iso_string[7] == '-'
+        and iso_string[10] in 'T '
+        and iso_string[13] == iso_string[16] == ':'
+    ):
+        return f"{iso_string[:10]} {iso_string[11:19]}"
+    from datetime import datetime
+
     try:
-        dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.fromisoformat(iso_string).strftime("%Y-%m-%d %H:%M:%S")
     except Exception:
         return iso_string
 
 
-def print_json(data):
-    print(json.dumps(data, indent=2))
+def write_stdout_bytes(data: bytes):
+    """Write encoded output to stdout, going straight to the file descriptor for large payloads."""
+    # Flush pending text so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream such as io.StringIO
+        sys.stdout.write(data.decode())
+        return
+    if len(data) < LARGE_OUTPUT_BYTES:
+        buffer.write(data)
+        return
+
+    buffer.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError):
+        # stdout replaced by an in-memory stream
+        buffer.write(data)
+        return
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def load_json_file(path):
+    """Parse a JSON file from a read-only memory map rather than a copied bytes object."""
+    import mmap
+
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and pipes can't be mapped
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def print_json(data, compact: bool = False):
+    option = orjson.OPT_APPEND_NEWLINE
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    write_stdout_bytes(orjson.dumps(data, option=option))
+
+
+def print_raw_json(body: bytes):
+    """Write an already-encoded JSON body to stdout as-is."""
+    write_stdout_bytes(body)
+    if not body.endswith(b"\n"):
+        write_stdout_bytes(b"\n")
+
+
+def stream_raw_json(chunks):
+    """Copy an already-encoded JSON body to stdout chunk by chunk."""
+    last = b"\n"
+    for chunk in chunks:
+        if chunk:
+            write_stdout_bytes(chunk)
+            last = chunk[-1:]
+    if last != b"\n":
+        write_stdout_bytes(b"\n")
+
+
+def print_lines(lines: list[str]):
+    """Write lines to stdout in a single call instead of one print per row."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_workflows(client: N8nClient, args):
@@ -122,24 +219,32 @@ def cmd_workflows(client: N8nClient, args):
     result = client.get_all_pages(client.get_workflows, active=active)
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     if not result:
         print("No workflows found.")
         return
 
-    print(f"{'ID':<20} {'NAME':<40} {'ACTIVE':<8} {'UPDATED':<20}")
-    print("-" * 90)
-    for wf in result:
-        print(f"{wf['id']:<20} {wf['name'][:38]:<40} {str(wf.get('active', False)):<8} {format_time(wf.get('updatedAt')):<20}")
+    row = "{:<20} {:<40} {:<8} {:<20}".format
+    lines = [row('ID', 'NAME', 'ACTIVE', 'UPDATED'), "-" * 90]
+    lines.extend(
+        row(wf['id'], wf['name'][:38], str(wf.get('active', False)), format_time(wf.get('updatedAt')))
+        for wf in result
+    )
+    print_lines(lines)
 
 
 def cmd_workflow(client: N8nClient, args):
+    if args.json and args.compact:
+        # The API already returns compact JSON; pass it through without decoding
+        print_raw_json(client.get_workflow_raw(args.id))
+        return
+
     wf = client.get_workflow(args.id)
 
     if args.json:
-        print_json(wf)
+        print_json(wf, args.compact)
         return
 
     print(f"ID:        {wf['id']}")
@@ -156,8 +261,7 @@ def cmd_workflow(client: N8nClient, args):
 
 
 def cmd_create(client: N8nClient, args):
-    with open(args.file) as f:
-        workflow = json.load(f)
+    workflow = load_json_file(args.file)
 
     if args.name:
         workflow["name"] = args.name
@@ -169,7 +273,7 @@ def cmd_create(client: N8nClient, args):
         client.transfer_workflow(workflow_id, args.project)
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     print(f"Workflow created: {result.get('name')}")
@@ -180,8 +284,7 @@ def cmd_create(client: N8nClient, args):
 
 
 def cmd_update(client: N8nClient, args):
-    with open(args.file) as f:
-        workflow_data = json.load(f)
+    workflow_data = load_json_file(args.file)
 
     # Extract only the fields that can be updated
     update_payload = {
@@ -198,7 +301,7 @@ def cmd_update(client: N8nClient, args):
     result = client.update_workflow(args.id, update_payload)
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     print(f"Workflow updated: {result.get('name')}")
@@ -210,26 +313,28 @@ def cmd_nodes(client: N8nClient, args):
     nodes = wf.get("nodes", [])
 
     if args.json:
-        print_json(nodes)
+        print_json(nodes, args.compact)
         return
 
     if not nodes:
         print("No nodes found.")
         return
 
-    print(f"{'NAME':<40} {'TYPE':<50}")
-    print("-" * 92)
+    row = "{:<40} {:<50}".format
+    lines = [row('NAME', 'TYPE'), "-" * 92]
+    code_count = 0
     for node in nodes:
         name = node.get('name', 'unnamed')[:38]
         node_type = node.get('type', 'unknown')
-        # Mark Code nodes
+        # Mark and count Code nodes
         if node_type == 'n8n-nodes-base.code':
             node_type = f"{node_type} *"
-        print(f"{name:<40} {node_type:<50}")
+            code_count += 1
+        lines.append(row(name, node_type))
 
-    code_count = sum(1 for n in nodes if n.get('type') == 'n8n-nodes-base.code')
     if code_count:
-        print(f"\n* {code_count} Code node(s) - use 'node <id> <name> --code' to view")
+        lines.append(f"\n* {code_count} Code node(s) - use 'node <id> <name> --code' to view")
+    print_lines(lines)
 
 
 def set_nested_param(obj: dict, key: str, value):
@@ -242,29 +347,66 @@ def set_nested_param(obj: dict, key: str, value):
     obj[parts[-1]] = value
 
 
+def deep_merge(base: dict, updates: dict) -> None:
+    """Merge updates into base, descending into nested dicts and replacing other values."""
+    stack = [(base, updates)]
+    while stack:
+        base, updates = stack.pop()
+        for key, value in updates.items():
+            current = base.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                base[key] = value
+
+
 def get_node_type_full(shorthand: str) -> str:
     """Convert type shorthand to full n8n type."""
     return NODE_TYPE_SHORTCUTS.get(shorthand, shorthand)
 
 
+def index_nodes(nodes: list) -> dict:
+    """Map node names to nodes for constant-time lookup."""
+    return {n.get('name'): n for n in nodes}
+
+
 def calculate_node_position(nodes: list) -> list:
     """Calculate position for new node (rightmost + 200px offset)."""
     if not nodes:
         return [200, 200]
-    max_x = max(n.get("position", [0, 0])[0] for n in nodes)
-    avg_y = sum(n.get("position", [0, 0])[1] for n in nodes) // len(nodes)
-    return [max_x + 200, avg_y]
+    max_x = None
+    total_y = 0
+    for n in nodes:
+        position = n.get("position", (0, 0))
+        if max_x is None or position[0] > max_x:
+            max_x = position[0]
+        total_y += position[1]
+    return [max_x + 200, total_y // len(nodes)]
 
 
 def build_workflow_payload(wf: dict, nodes: list) -> dict:
     """Build the payload for updating a workflow."""
-    return {
+    payload = {
         'name': wf['name'],
         'nodes': nodes,
         'connections': wf['connections'],
         'settings': wf.get('settings', {}),
-        'staticData': wf.get('staticData'),
     }
+    # The API has no partial update; staticData is the only optional field, so skip it when unset
+    if wf.get('staticData') is not None:
+        payload['staticData'] = wf['staticData']
+    return payload
+
+
+def rename_node_in_connections(connections: dict, old_name: str, new_name: str) -> None:
+    """Rename a node in the connections map, both as a source and as a target."""
+    if old_name in connections:
+        connections[new_name] = connections.pop(old_name)
+    for conn in connections.values():
+        for outputs in conn.get('main', ()):
+            for output in outputs:
+                if output['node'] == old_name:
+                    output['node'] = new_name
 
 
 def handle_add_node(client: N8nClient, wf: dict, args) -> None:
@@ -278,10 +420,9 @@ def handle_add_node(client: N8nClient, wf: dict, args) -> None:
         print("--name is required when using --add", file=sys.stderr)
         sys.exit(1)
 
-    for n in nodes:
-        if n.get('name') == args.new_name:
-            print(f"Node with name '{args.new_name}' already exists.", file=sys.stderr)
-            sys.exit(1)
+    if args.new_name in index_nodes(nodes):
+        print(f"Node with name '{args.new_name}' already exists.", file=sys.stderr)
+        sys.exit(1)
 
     node_type = get_node_type_full(args.node_type)
 
@@ -326,8 +467,8 @@ def handle_add_node(client: N8nClient, wf: dict, args) -> None:
                 sys.exit(1)
             key, value = param.split('=', 1)
             try:
-                value = json.loads(value)
-            except json.JSONDecodeError:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
                 pass
             set_nested_param(new_node['parameters'], key, value)
 
@@ -395,19 +536,13 @@ def handle_add_switch_rule(client: N8nClient, wf: dict, node: dict, args) -> Non
     }
 
     rules = node['parameters']['rules']['values']
-    fallback_idx = None
-    for i, rule in enumerate(rules):
-        if rule.get('outputKey') == 'fallback' or rule.get('outputKey') == 'Fallback':
-            fallback_idx = i
-            break
-
-    if fallback_idx is not None:
-        rules.insert(fallback_idx, new_rule)
-    else:
-        rules.append(new_rule)
+    rule_idx = next(
+        (i for i, rule in enumerate(rules) if rule.get('outputKey') in FALLBACK_OUTPUT_KEYS),
+        len(rules),
+    )
+    rules.insert(rule_idx, new_rule)
 
     client.update_workflow(args.id, build_workflow_payload(wf, nodes))
-    rule_idx = fallback_idx if fallback_idx is not None else len(rules) - 1
     print(f"Rule added to '{args.name}' at index {rule_idx}.")
     print(f"Condition: {args.field} {args.op} '{args.match_value}'")
     print(f"Output key: {args.output_key}")
@@ -418,13 +553,9 @@ def cmd_connect(client: N8nClient, args) -> None:
     wf = client.get_workflow(args.workflow_id)
     nodes = wf.get("nodes", [])
 
-    source_node = None
-    target_node = None
-    for n in nodes:
-        if n.get('name') == args.source:
-            source_node = n
-        if n.get('name') == args.target:
-            target_node = n
+    node_map = index_nodes(nodes)
+    source_node = node_map.get(args.source)
+    target_node = node_map.get(args.target)
 
     if not source_node:
         print(f"Source node '{args.source}' not found.", file=sys.stderr)
@@ -516,47 +647,36 @@ def cmd_node(client: N8nClient, args):
         sys.exit(1)
 
     # Find the node by name
-    node = None
-    for n in nodes:
-        if n.get('name') == args.name:
-            node = n
-            break
+    node_map = index_nodes(nodes)
+    node = node_map.get(args.name)
 
     if not node:
         print(f"Node '{args.name}' not found.", file=sys.stderr)
         print("\nAvailable nodes:")
-        for n in nodes:
-            print(f"  - {n.get('name')}")
+        for name in node_map:
+            print(f"  - {name}")
+        sys.exit(1)
+
+    if args.rename and args.rename != args.name and args.rename in node_map:
+        print(f"Node with name '{args.rename}' already exists.", file=sys.stderr)
         sys.exit(1)
 
     if args.add_rule:
         return handle_add_switch_rule(client, wf, node, args)
 
+    def save(message):
+        client.update_workflow(args.id, build_workflow_payload(wf, nodes))
+        print(message)
+
     # Handle --set-param-json (bulk parameter update)
     if args.set_param_json:
-        param_data = json.loads(args.set_param_json)
+        param_data = orjson.loads(args.set_param_json)
         if 'parameters' not in node:
             node['parameters'] = {}
 
-        def deep_merge(base, updates):
-            for key, value in updates.items():
-                if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-                    deep_merge(base[key], value)
-                else:
-                    base[key] = value
-
         deep_merge(node['parameters'], param_data)
 
-        update_payload = {
-            'name': wf['name'],
-            'nodes': nodes,
-            'connections': wf['connections'],
-            'settings': wf.get('settings', {}),
-            'staticData': wf.get('staticData'),
-        }
-
-        client.update_workflow(args.id, update_payload)
-        print(f"Node '{args.name}' parameters updated.")
+        save(f"Node '{args.name}' parameters updated.")
         return
 
     # Handle --set-param (single parameter update)
@@ -573,25 +693,17 @@ def cmd_node(client: N8nClient, args):
 
             # Try to parse value as JSON for complex types
             try:
-                value = json.loads(value)
-            except json.JSONDecodeError:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
                 pass  # Keep as string
 
             set_nested_param(node['parameters'], key, value)
 
-        update_payload = {
-            'name': wf['name'],
-            'nodes': nodes,
-            'connections': wf['connections'],
-            'settings': wf.get('settings', {}),
-            'staticData': wf.get('staticData'),
-        }
-
-        client.update_workflow(args.id, update_payload)
-        print(f"Node '{args.name}' parameters updated.")
+        save(f"Node '{args.name}' parameters updated.")
         return
 
     # Handle --set-code
+    if args.set_code:
         if node.get('type') != 'n8n-nodes-base.code':
             print(f"Node '{args.name}' is not a Code node.", file=sys.stderr)
             sys.exit(1)
@@ -605,56 +717,19 @@ def cmd_node(client: N8nClient, args):
         old_name = node['name']
         if args.rename:
             node['name'] = args.rename
-            # Update connections
-            if old_name in wf['connections']:
-                wf['connections'][args.rename] = wf['connections'].pop(old_name)
-            for conn_name, conn in wf['connections'].items():
-                if 'main' in conn:
-                    for outputs in conn['main']:
-                        for output in outputs:
-                            if output.get('node') == old_name:
-                                output['node'] = args.rename
-
-        update_payload = {
-            'name': wf['name'],
-            'nodes': nodes,
-            'connections': wf['connections'],
-            'settings': wf.get('settings', {}),
-            'staticData': wf.get('staticData'),
-        }
-
-        client.update_workflow(args.id, update_payload)
-        if args.rename:
-            print(f"Node '{old_name}' renamed to '{args.rename}' and code updated.")
+            rename_node_in_connections(wf['connections'], old_name, args.rename)
+            save(f"Node '{old_name}' renamed to '{args.rename}' and code updated.")
         else:
-            print(f"Node '{args.name}' code updated.")
+            save(f"Node '{args.name}' code updated.")
         return
 
     # Handle --rename only
     if args.rename:
         old_name = node['name']
         node['name'] = args.rename
+        rename_node_in_connections(wf['connections'], old_name, args.rename)
 
-        # Update connections
-        if old_name in wf['connections']:
-            wf['connections'][args.rename] = wf['connections'].pop(old_name)
-        for conn_name, conn in wf['connections'].items():
-            if 'main' in conn:
-                for outputs in conn['main']:
-                    for output in outputs:
-                        if output.get('node') == old_name:
-                            output['node'] = args.rename
-
-        update_payload = {
-            'name': wf['name'],
-            'nodes': nodes,
-            'connections': wf['connections'],
-            'settings': wf.get('settings', {}),
-            'staticData': wf.get('staticData'),
-        }
-
-        client.update_workflow(args.id, update_payload)
-        print(f"Node '{old_name}' renamed to '{args.rename}'.")
+        save(f"Node '{old_name}' renamed to '{args.rename}'.")
         return
 
     # Handle --code (view code)
@@ -669,7 +744,7 @@ def cmd_node(client: N8nClient, args):
 
     # Default: show node details
     if args.json:
-        print_json(node)
+        print_json(node, args.compact)
         return
 
     print(f"Name:       {node.get('name')}")
@@ -689,16 +764,61 @@ def cmd_node(client: N8nClient, args):
                 print(f"  {key}: {value}")
 
 
+def is_batch_edit(edit) -> bool:
+    """Check that a batch script entry names a node and only uses known keys with object values."""
+    return (
+        isinstance(edit, dict)
+        and isinstance(edit.get('node'), str)
+        and edit.keys() <= BATCH_EDIT_KEYS
+        and all(isinstance(edit.get(key, {}), dict) for key in ('set', 'merge'))
+    )
+
+
+def cmd_batch(client: N8nClient, args):
+    """Apply parameter edits to several nodes with one fetch and one update."""
+    if args.script == '-':
+        script = orjson.loads(sys.stdin.buffer.read())
+    else:
+        script = load_json_file(args.script)
+
+    if not isinstance(script, list) or not all(is_batch_edit(e) for e in script):
+        print('Batch script must be a JSON list of {"node": ..., "set": {...}, "merge": {...}} objects.', file=sys.stderr)
+        sys.exit(1)
+
+    if not script:
+        print("No edits to apply.")
+        return
+
+    wf = client.get_workflow(args.id)
+    nodes = wf.get("nodes", [])
+    node_map = index_nodes(nodes)
+
+    missing = [e['node'] for e in script if e['node'] not in node_map]
+    if missing:
+        print(f"Node(s) not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    for edit in script:
+        params = node_map[edit['node']].setdefault('parameters', {})
+        for key, value in edit.get('set', {}).items():
+            set_nested_param(params, key, value)
+        deep_merge(params, edit.get('merge', {}))
+
+    client.update_workflow(args.id, build_workflow_payload(wf, nodes))
+    print(f"Applied {len(script)} edit(s) to workflow {args.id}.")
+
+
 def sanitize_filename(name: str) -> str:
     """Convert node name to safe filename."""
-    # Replace spaces and special chars with underscores
-    safe = re.sub(r'[^\w\-]', '_', name)
-    # Remove consecutive underscores
-    safe = re.sub(r'_+', '_', safe)
+    # Replace spaces and special chars with underscores, collapsing consecutive ones
+    safe = UNSAFE_FILENAME_CHARS.sub('_', name)
     return safe.strip('_').lower()
 
 
 def cmd_export_code(client: N8nClient, args):
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
     wf = client.get_workflow(args.id)
     nodes = wf.get("nodes", [])
 
@@ -720,31 +840,35 @@ def cmd_export_code(client: N8nClient, args):
         'nodes': {}
     }
 
+    files = {}
     exported = 0
     for node in code_nodes:
         name = node.get('name', 'unnamed')
         code = node.get('parameters', {}).get('jsCode', '')
 
         filename = sanitize_filename(name) + '.js'
-        filepath = output_dir / filename
-
-        with open(filepath, 'w') as f:
-            f.write(code)
+        files[output_dir / filename] = code
 
         manifest['nodes'][filename] = name
         exported += 1
         print(f"Exported: {name} -> {filename}")
 
+    # Scripts are independent files, so write them concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(files))) as pool:
+        list(pool.map(Path.write_text, files.keys(), files.values()))
+
     # Write manifest
     manifest_path = output_dir / '_manifest.json'
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
     print(f"\nExported {exported} Code node(s) to {output_dir}/")
     print(f"Manifest: {manifest_path}")
 
 
 def cmd_import_code(client: N8nClient, args):
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
     input_dir = Path(args.input_dir)
 
     # Read manifest
@@ -754,21 +878,31 @@ def cmd_import_code(client: N8nClient, args):
         print("Run 'export-code' first to create the manifest.")
         sys.exit(1)
 
-    with open(manifest_path) as f:
-        manifest = json.load(f)
+    manifest = load_json_file(manifest_path)
 
     # Get current workflow
     wf = client.get_workflow(args.id)
     nodes = wf.get("nodes", [])
 
     # Create node name lookup
-    node_map = {n.get('name'): n for n in nodes}
+    node_map = index_nodes(nodes)
+
+    entries = manifest['nodes']
+
+    # One directory scan tells which scripts exist, instead of probing each path
+    with os.scandir(input_dir) as it:
+        present = {entry.name for entry in it}
+
+    # Read scripts concurrently; the comparison below stays sequential to keep output order
+    filepaths = [input_dir / filename for filename in entries if filename in present]
+    with ThreadPoolExecutor(max_workers=min(16, len(filepaths) or 1)) as pool:
+        contents = dict(zip(filepaths, pool.map(Path.read_text, filepaths)))
 
     updated = 0
-    for filename, node_name in manifest['nodes'].items():
+    for filename, node_name in entries.items():
         filepath = input_dir / filename
 
-        if not filepath.exists():
+        if filepath not in contents:
             print(f"Skipping: {filename} (file not found)")
             continue
 
@@ -781,10 +915,9 @@ def cmd_import_code(client: N8nClient, args):
             print(f"Skipping: {node_name} (not a Code node)")
             continue
 
-        with open(filepath) as f:
-            new_code = f.read()
-
         old_code = node.get('parameters', {}).get('jsCode', '')
+        new_code = contents[filepath]
+
         if new_code == old_code:
             print(f"Unchanged: {node_name}")
             continue
@@ -798,15 +931,7 @@ def cmd_import_code(client: N8nClient, args):
         return
 
     # Push update
-    update_payload = {
-        'name': wf['name'],
-        'nodes': nodes,
-        'connections': wf['connections'],
-        'settings': wf.get('settings', {}),
-        'staticData': wf.get('staticData'),
-    }
-
-    client.update_workflow(args.id, update_payload)
+    client.update_workflow(args.id, build_workflow_payload(wf, nodes))
     print(f"\nImported {updated} Code node(s).")
 
 
@@ -821,39 +946,47 @@ def cmd_deactivate(client: N8nClient, args):
 
 
 def cmd_executions(client: N8nClient, args):
+    limit = args.limit or 50
     result = client.get_all_pages(
         client.get_executions,
         workflow_id=args.workflow,
         status=args.status,
-        limit=args.limit,
+        limit=limit,
+        stop_after=limit,
     )
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     if not result:
         print("No executions found.")
         return
 
-    print(f"{'ID':<12} {'WORKFLOW':<30} {'STATUS':<10} {'STARTED':<20} {'FINISHED':<20}")
-    print("-" * 95)
-    for ex in result[:args.limit or 50]:
+    row = "{:<12} {:<30} {:<10} {:<20} {:<20}".format
+    lines = [row('ID', 'WORKFLOW', 'STATUS', 'STARTED', 'FINISHED'), "-" * 95]
+    for ex in result:
         wf_name = ex.get("workflowData", {}).get("name", ex.get("workflowId", "-"))[:28]
-        print(
-            f"{ex['id']:<12} "
-            f"{wf_name:<30} "
-            f"{ex.get('status', '-'):<10} "
-            f"{format_time(ex.get('startedAt')):<20} "
-            f"{format_time(ex.get('stoppedAt')):<20}"
-        )
+        lines.append(row(
+            ex['id'],
+            wf_name,
+            ex.get('status', '-'),
+            format_time(ex.get('startedAt')),
+            format_time(ex.get('stoppedAt')),
+        ))
+    print_lines(lines)
 
 
 def cmd_execution(client: N8nClient, args):
+    if args.json and args.compact:
+        # The API already returns compact JSON; stream it through without decoding or buffering
+        stream_raw_json(client.iter_execution_raw(args.id, include_data=args.data))
+        return
+
     ex = client.get_execution(args.id, include_data=args.data)
 
     if args.json:
-        print_json(ex)
+        print_json(ex, args.compact)
         return
 
     print(f"ID:         {ex['id']}")
@@ -882,7 +1015,7 @@ def cmd_execution(client: N8nClient, args):
 
     if args.data and ex.get("data"):
         print("\n--- EXECUTION DATA ---")
-        print_json(ex["data"])
+        print_json(ex["data"], args.compact)
 
 
 def cmd_retry(client: N8nClient, args):
@@ -894,12 +1027,12 @@ def cmd_retry(client: N8nClient, args):
 def cmd_run(client: N8nClient, args):
     data = None
     if args.data:
-        data = json.loads(args.data)
+        data = orjson.loads(args.data)
 
     result = client.run_workflow(args.id, data=data)
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     print(f"Workflow executed.")
@@ -919,67 +1052,73 @@ def cmd_run(client: N8nClient, args):
                         for items in run["data"]["main"]:
                             if items:
                                 for item in items:
-                                    print(f"    Output: {json.dumps(item.get('json', {}), indent=2)}")
+                                    output = orjson.dumps(item.get('json', {}), option=orjson.OPT_INDENT_2).decode()
+                                    print(f"    Output: {output}")
 
 
 def cmd_trigger(client: N8nClient, args):
-    import httpx
-
-    # Find workflow by name
-    workflows = client.get_all_pages(client.get_workflows)
-    matching = [w for w in workflows if args.name.lower() in w['name'].lower()]
-
-    if not matching:
-        print(f"No workflow found matching '{args.name}'", file=sys.stderr)
-        sys.exit(1)
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Find workflow by name. The list endpoint usually includes nodes already; if the
+    # first match doesn't, fetch it while the remaining pages are checked for duplicates.
+    # Every workflow is scanned client-side: the server's name filter may be case-sensitive,
+    # and missing a match would skip the ambiguity check below
+    needle = args.name.lower()
+    matching = []
+    details = None
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        for page in client.iter_pages(client.get_workflows):
+            for w in page:
+                if needle in w['name'].lower():
+                    matching.append(w)
+                    if details is None and not w.get('nodes'):
+                        details = pool.submit(client.get_workflow, w['id'])
+
+        if not matching:
+            print(f"No workflow found matching '{args.name}'", file=sys.stderr)
+            sys.exit(1)
 
-    if len(matching) > 1:
-        print(f"Multiple workflows match '{args.name}':")
-        for w in matching:
-            print(f"  - {w['id']}: {w['name']}")
-        sys.exit(1)
+        if len(matching) > 1:
+            print(f"Multiple workflows match '{args.name}':")
+            for w in matching:
+                print(f"  - {w['id']}: {w['name']}")
+            sys.exit(1)
 
-    workflow = client.get_workflow(matching[0]['id'])
+        workflow = details.result() if details else matching[0]
 
-    # Find webhook node
-    webhook_node = None
-    for node in workflow.get('nodes', []):
-        if node.get('type') == 'n8n-nodes-base.webhook':
-            webhook_node = node
-            break
+    webhook_node = next(
+        (node for node in workflow.get('nodes', []) if node.get('type') == 'n8n-nodes-base.webhook'),
+        None,
+    )
 
     if not webhook_node:
         print(f"Workflow '{workflow['name']}' has no webhook trigger", file=sys.stderr)
         sys.exit(1)
 
     # Build webhook URL
-    path = webhook_node['parameters'].get('path', webhook_node.get('webhookId', ''))
+    params = webhook_node['parameters']
+    path = params.get('path', webhook_node.get('webhookId', ''))
     base_url = os.environ.get('N8N_BASE_URL', '').rstrip('/')
 
     # Use test webhook if --test flag is set
     webhook_type = "webhook-test" if args.test else "webhook"
     webhook_url = f"{base_url}/{webhook_type}/{path}"
 
-    method = webhook_node['parameters'].get('httpMethod', 'GET')
+    method = params.get('httpMethod', 'GET')
 
     # Build payload
     payload = {}
     if args.file:
-        with open(args.file) as f:
-            payload = json.load(f)
+        payload = load_json_file(args.file)
     elif args.data:
-        payload = json.loads(args.data)
+        payload = orjson.loads(args.data)
 
-    # Call webhook
-    with httpx.Client(timeout=60.0) as http:
-        if method == 'GET':
-            response = http.get(webhook_url, params=payload if payload else None)
-        else:
-            response = http.post(webhook_url, json=payload)
+    # Call webhook over the API client's connection pool
+    response = client.trigger_webhook(webhook_url, method, payload)
 
     if args.json:
         try:
-            print_json(response.json())
+            print_json(response.json(), args.compact)
         except Exception:
             print(response.text)
         return
@@ -988,7 +1127,8 @@ def cmd_trigger(client: N8nClient, args):
     print(f"Webhook: {webhook_url}")
     print(f"Status: {response.status_code}")
     if payload:
-        print(f"Payload: {json.dumps(payload)[:100]}{'...' if len(json.dumps(payload)) > 100 else ''}")
+        blob = orjson.dumps(payload)
+        print(f"Payload: {blob[:100].decode(errors='ignore')}{'...' if len(blob) > 100 else ''}")
     try:
         result = response.json()
         if isinstance(result, dict):
@@ -1006,24 +1146,24 @@ def cmd_credentials(client: N8nClient, args):
     result = client.get_all_pages(client.get_credentials)
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     if not result:
         print("No credentials found.")
         return
 
-    print(f"{'ID':<20} {'NAME':<40} {'TYPE':<30}")
-    print("-" * 92)
-    for cred in result:
-        print(f"{cred['id']:<20} {cred['name'][:38]:<40} {cred.get('type', '-'):<30}")
+    row = "{:<20} {:<40} {:<30}".format
+    lines = [row('ID', 'NAME', 'TYPE'), "-" * 92]
+    lines += [row(cred['id'], cred['name'][:38], cred.get('type', '-')) for cred in result]
+    print_lines(lines)
 
 
 def cmd_credential_schema(client: N8nClient, args):
     schema = client.get_credential_schema(args.type)
 
     if args.json:
-        print_json(schema)
+        print_json(schema, args.compact)
         return
 
     print(f"Schema for: {args.type}\n")
@@ -1033,23 +1173,25 @@ def cmd_credential_schema(client: N8nClient, args):
         print("No properties defined.")
         return
 
-    print(f"{'NAME':<25} {'TYPE':<15} {'REQUIRED':<10} {'DESCRIPTION'}")
-    print("-" * 90)
+    row = "{:<25} {:<15} {:<10} {}".format
+    lines = [row('NAME', 'TYPE', 'REQUIRED', 'DESCRIPTION'), "-" * 90]
     for prop in properties:
-        name = prop.get('name', prop.get('displayName', '-'))
-        prop_type = prop.get('type', '-')
-        required = 'yes' if prop.get('required') else 'no'
-        desc = prop.get('description', '-')[:40]
-        print(f"{name:<25} {prop_type:<15} {required:<10} {desc}")
+        get = prop.get
+        lines.append(row(
+            get('name', get('displayName', '-')),
+            get('type', '-'),
+            'yes' if get('required') else 'no',
+            get('description', '-')[:40],
+        ))
+    print_lines(lines)
 
 
 def cmd_create_credential(client: N8nClient, args):
     data = {}
     if args.data:
-        data = json.loads(args.data)
+        data = orjson.loads(args.data)
     elif args.data_file:
-        with open(args.data_file) as f:
-            data = json.load(f)
+        data = load_json_file(args.data_file)
 
     credential = {
         'name': args.name,
@@ -1060,7 +1202,7 @@ def cmd_create_credential(client: N8nClient, args):
     result = client.create_credential(credential)
 
     if args.json:
-        print_json(result)
+        print_json(result, args.compact)
         return
 
     print(f"Credential created: {result.get('name')}")
@@ -1073,49 +1215,51 @@ def cmd_delete_credential(client: N8nClient, args):
     print(f"Credential {args.id} deleted.")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="n8n CLI - Manage workflows and troubleshoot executions",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
+@functools.cache
+def json_options() -> argparse.ArgumentParser:
+    """Parent parser with the output flags shared by commands that can print JSON."""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--json", action="store_true", help="Output as JSON")
+    parent.add_argument("--compact", action="store_true", help="Output JSON without indentation")
+    return parent
 
-    # workflows
-    p_workflows = subparsers.add_parser("workflows", help="List all workflows")
+
+def add_workflows_parser(subparsers):
+    p_workflows = subparsers.add_parser("workflows", parents=[json_options()], help="List all workflows")
     p_workflows.add_argument("--active", action="store_true", help="Show only active workflows")
     p_workflows.add_argument("--inactive", action="store_true", help="Show only inactive workflows")
-    p_workflows.add_argument("--json", action="store_true", help="Output as JSON")
     p_workflows.set_defaults(func=cmd_workflows)
 
-    # workflow
-    p_workflow = subparsers.add_parser("workflow", help="Get workflow details")
+
+def add_workflow_parser(subparsers):
+    p_workflow = subparsers.add_parser("workflow", parents=[json_options()], help="Get workflow details")
     p_workflow.add_argument("id", help="Workflow ID")
-    p_workflow.add_argument("--json", action="store_true", help="Output as JSON")
     p_workflow.set_defaults(func=cmd_workflow)
 
-    # create
-    p_create = subparsers.add_parser("create", help="Create a workflow from JSON file")
+
+def add_create_parser(subparsers):
+    p_create = subparsers.add_parser("create", parents=[json_options()], help="Create a workflow from JSON file")
     p_create.add_argument("file", help="Path to workflow JSON file")
     p_create.add_argument("--name", "-n", help="Override workflow name")
     p_create.add_argument("--project", "-p", help="Project ID to create workflow in")
-    p_create.add_argument("--json", action="store_true", help="Output as JSON")
     p_create.set_defaults(func=cmd_create)
 
-    # update
-    p_update = subparsers.add_parser("update", help="Update a workflow from JSON file")
+
+def add_update_parser(subparsers):
+    p_update = subparsers.add_parser("update", parents=[json_options()], help="Update a workflow from JSON file")
     p_update.add_argument("id", help="Workflow ID")
     p_update.add_argument("file", help="Path to workflow JSON file")
-    p_update.add_argument("--json", action="store_true", help="Output as JSON")
     p_update.set_defaults(func=cmd_update)
 
-    # nodes
-    p_nodes = subparsers.add_parser("nodes", help="List nodes in a workflow")
+
+def add_nodes_parser(subparsers):
+    p_nodes = subparsers.add_parser("nodes", parents=[json_options()], help="List nodes in a workflow")
     p_nodes.add_argument("id", help="Workflow ID")
-    p_nodes.add_argument("--json", action="store_true", help="Output as JSON")
     p_nodes.set_defaults(func=cmd_nodes)
 
-    # node
-    p_node = subparsers.add_parser("node", help="View, edit, or create nodes")
+
+def add_node_parser(subparsers):
+    p_node = subparsers.add_parser("node", parents=[json_options()], help="View, edit, or create nodes")
     p_node.add_argument("id", help="Workflow ID")
     p_node.add_argument("name", nargs="?", help="Node name (required except with --add)")
     p_node.add_argument("--code", "-c", action="store_true", help="Show node code (Code nodes only)")
@@ -1123,7 +1267,6 @@ def main():
     p_node.add_argument("--set-param", "-p", action="append", metavar="KEY=VALUE", help="Set a node parameter (can be used multiple times, supports dot notation for nested keys)")
     p_node.add_argument("--set-param-json", metavar="JSON", help="Set node parameters from JSON object (deep merged)")
     p_node.add_argument("--rename", "-r", metavar="NAME", help="Rename the node")
-    p_node.add_argument("--json", action="store_true", help="Output as JSON")
     p_node.add_argument("--add", action="store_true", help="Create a new node")
     p_node.add_argument("--type", dest="node_type", help="Node type for --add (e.g., 'code', 'switch', or full type)")
     p_node.add_argument("--name", dest="new_name", metavar="NAME", help="Node name for --add")
@@ -1131,73 +1274,85 @@ def main():
     p_node.add_argument("--param", action="append", metavar="KEY=VALUE", help="Set a parameter for new node (--add)")
     p_node.add_argument("--add-rule", action="store_true", help="Add rule to Switch node")
     p_node.add_argument("--field", help="Field to match for --add-rule (e.g., 'title')")
-    p_node.add_argument("--op", choices=["contains", "equals", "not-equals", "starts-with", "ends-with", "regex"],
-                        help="Match operator for --add-rule")
+    p_node.add_argument("--op", choices=SWITCH_OPERATORS, help="Match operator for --add-rule")
     p_node.add_argument("--match-value", help="Value to match for --add-rule")
     p_node.add_argument("--output-key", help="Output key name for --add-rule")
     p_node.set_defaults(func=cmd_node)
 
-    # export-code
+
+def add_batch_parser(subparsers):
+    p_batch = subparsers.add_parser("batch", help="Apply a JSON script of node parameter edits in one update")
+    p_batch.add_argument("id", help="Workflow ID")
+    p_batch.add_argument("script", help='JSON file (or - for stdin) with [{"node": ..., "set": {...}, "merge": {...}}]')
+    p_batch.set_defaults(func=cmd_batch)
+
+
+def add_export_code_parser(subparsers):
     p_export = subparsers.add_parser("export-code", help="Export Code node scripts to files")
     p_export.add_argument("id", help="Workflow ID")
     p_export.add_argument("output_dir", help="Output directory for scripts")
     p_export.set_defaults(func=cmd_export_code)
 
-    # import-code
+
+def add_import_code_parser(subparsers):
     p_import = subparsers.add_parser("import-code", help="Import Code node scripts from files")
     p_import.add_argument("id", help="Workflow ID")
     p_import.add_argument("input_dir", help="Directory containing scripts and manifest")
     p_import.set_defaults(func=cmd_import_code)
 
-    # activate
+
+def add_activate_parser(subparsers):
     p_activate = subparsers.add_parser("activate", help="Activate a workflow")
     p_activate.add_argument("id", help="Workflow ID")
     p_activate.set_defaults(func=cmd_activate)
 
-    # deactivate
+
+def add_deactivate_parser(subparsers):
     p_deactivate = subparsers.add_parser("deactivate", help="Deactivate a workflow")
     p_deactivate.add_argument("id", help="Workflow ID")
     p_deactivate.set_defaults(func=cmd_deactivate)
 
-    # executions
-    p_executions = subparsers.add_parser("executions", help="List executions")
+
+def add_executions_parser(subparsers):
+    p_executions = subparsers.add_parser("executions", parents=[json_options()], help="List executions")
     p_executions.add_argument("--workflow", "-w", help="Filter by workflow ID")
-    p_executions.add_argument("--status", "-s", choices=["canceled", "error", "running", "success", "waiting"], help="Filter by status")
+    p_executions.add_argument("--status", "-s", choices=EXECUTION_STATUSES, help="Filter by status")
     p_executions.add_argument("--limit", "-n", type=int, default=50, help="Max results (default: 50)")
-    p_executions.add_argument("--json", action="store_true", help="Output as JSON")
     p_executions.set_defaults(func=cmd_executions)
 
-    # execution
-    p_execution = subparsers.add_parser("execution", help="Get execution details")
+
+def add_execution_parser(subparsers):
+    p_execution = subparsers.add_parser("execution", parents=[json_options()], help="Get execution details")
     p_execution.add_argument("id", help="Execution ID")
     p_execution.add_argument("--data", "-d", action="store_true", help="Include full execution data")
-    p_execution.add_argument("--json", action="store_true", help="Output as JSON")
     p_execution.set_defaults(func=cmd_execution)
 
-    # retry
+
+def add_retry_parser(subparsers):
     p_retry = subparsers.add_parser("retry", help="Retry a failed execution")
     p_retry.add_argument("id", help="Execution ID")
     p_retry.add_argument("--latest", action="store_true", help="Use latest workflow version instead of original")
     p_retry.set_defaults(func=cmd_retry)
 
-    # run
-    p_run = subparsers.add_parser("run", help="Execute a workflow manually")
+
+def add_run_parser(subparsers):
+    p_run = subparsers.add_parser("run", parents=[json_options()], help="Execute a workflow manually")
     p_run.add_argument("id", help="Workflow ID")
     p_run.add_argument("--data", "-d", help="Input data as JSON string")
     p_run.add_argument("--output", "-o", action="store_true", help="Show node outputs")
-    p_run.add_argument("--json", action="store_true", help="Output full result as JSON")
     p_run.set_defaults(func=cmd_run)
 
-    # trigger
-    p_trigger = subparsers.add_parser("trigger", help="Trigger a workflow by name (via webhook)")
+
+def add_trigger_parser(subparsers):
+    p_trigger = subparsers.add_parser("trigger", parents=[json_options()], help="Trigger a workflow by name (via webhook)")
     p_trigger.add_argument("name", help="Workflow name (partial match)")
     p_trigger.add_argument("--data", "-d", help="JSON payload to send")
     p_trigger.add_argument("--file", "-f", help="File containing JSON payload")
     p_trigger.add_argument("--test", "-t", action="store_true", help="Use test webhook URL")
-    p_trigger.add_argument("--json", action="store_true", help="Output full result as JSON")
     p_trigger.set_defaults(func=cmd_trigger)
 
-    # connect
+
+def add_connect_parser(subparsers):
     p_connect = subparsers.add_parser("connect", help="Add connection between nodes")
     p_connect.add_argument("workflow_id", help="Workflow ID")
     p_connect.add_argument("source", help="Source node name")
@@ -1205,7 +1360,8 @@ def main():
     p_connect.add_argument("--output", type=int, default=0, help="Output index (default: 0)")
     p_connect.set_defaults(func=cmd_connect)
 
-    # disconnect
+
+def add_disconnect_parser(subparsers):
     p_disconnect = subparsers.add_parser("disconnect", help="Remove connection between nodes")
     p_disconnect.add_argument("workflow_id", help="Workflow ID")
     p_disconnect.add_argument("source", help="Source node name")
@@ -1213,36 +1369,87 @@ def main():
     p_disconnect.add_argument("--output", type=int, help="Output index (removes from specific output)")
     p_disconnect.set_defaults(func=cmd_disconnect)
 
-    # credentials
-    p_credentials = subparsers.add_parser("credentials", help="List all credentials")
-    p_credentials.add_argument("--json", action="store_true", help="Output as JSON")
+
+def add_credentials_parser(subparsers):
+    p_credentials = subparsers.add_parser("credentials", parents=[json_options()], help="List all credentials")
     p_credentials.set_defaults(func=cmd_credentials)
 
-    # credential-schema
-    p_cred_schema = subparsers.add_parser("credential-schema", help="Get schema for a credential type")
+
+def add_credential_schema_parser(subparsers):
+    p_cred_schema = subparsers.add_parser("credential-schema", parents=[json_options()], help="Get schema for a credential type")
     p_cred_schema.add_argument("type", help="Credential type (e.g., httpHeaderAuth, openAiApi)")
-    p_cred_schema.add_argument("--json", action="store_true", help="Output as JSON")
     p_cred_schema.set_defaults(func=cmd_credential_schema)
 
-    # create-credential
-    p_create_cred = subparsers.add_parser("create-credential", help="Create a new credential")
+
+def add_create_credential_parser(subparsers):
+    p_create_cred = subparsers.add_parser("create-credential", parents=[json_options()], help="Create a new credential")
     p_create_cred.add_argument("--name", "-n", required=True, help="Credential name")
     p_create_cred.add_argument("--type", "-t", required=True, help="Credential type")
     p_create_cred.add_argument("--data", "-d", help="Credential data as JSON string")
     p_create_cred.add_argument("--data-file", "-f", help="File containing credential data as JSON")
-    p_create_cred.add_argument("--json", action="store_true", help="Output as JSON")
     p_create_cred.set_defaults(func=cmd_create_credential)
 
-    # delete-credential
+
+def add_delete_credential_parser(subparsers):
     p_delete_cred = subparsers.add_parser("delete-credential", help="Delete a credential")
     p_delete_cred.add_argument("id", help="Credential ID")
     p_delete_cred.set_defaults(func=cmd_delete_credential)
 
-    args = parser.parse_args()
+
+# Parser builders per command, so a single invocation only builds the parser it needs
+COMMAND_PARSERS = {
+    "workflows": add_workflows_parser,
+    "workflow": add_workflow_parser,
+    "create": add_create_parser,
+    "update": add_update_parser,
+    "nodes": add_nodes_parser,
+    "node": add_node_parser,
+    "batch": add_batch_parser,
+    "export-code": add_export_code_parser,
+    "import-code": add_import_code_parser,
+    "activate": add_activate_parser,
+    "deactivate": add_deactivate_parser,
+    "executions": add_executions_parser,
+    "execution": add_execution_parser,
+    "retry": add_retry_parser,
+    "run": add_run_parser,
+    "trigger": add_trigger_parser,
+    "connect": add_connect_parser,
+    "disconnect": add_disconnect_parser,
+    "credentials": add_credentials_parser,
+    "credential-schema": add_credential_schema_parser,
+    "create-credential": add_create_credential_parser,
+    "delete-credential": add_delete_credential_parser,
+}
+
+
+def build_parser(argv: list[str]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="n8n CLI - Manage workflows and troubleshoot executions",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        # Colorized help re-checks the terminal on every add_argument call (3.14+)
+        **({"color": False} if sys.version_info >= (3, 14) else {}),
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    command = argv[0] if argv else None
+    if command in COMMAND_PARSERS:
+        COMMAND_PARSERS[command](subparsers)
+    else:
+        # Top-level help or an unknown command: list every command
+        for add_parser in COMMAND_PARSERS.values():
+            add_parser(subparsers)
+    return parser
+
+
+def main():
+    args = build_parser(sys.argv[1:]).parse_args()
 
     try:
-        client = N8nClient()
-        args.func(client, args)
+        from n8n_client import N8nClient
+
+        with N8nClient() as client:
+            args.func(client, args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -12,11 +12,23 @@ Usage:
     executions = client.get_executions(workflow_id="123")
 """
 
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
+
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Credential schemas only change when n8n is upgraded
+SCHEMA_CACHE_TTL = 24 * 60 * 60
 
 
 @dataclass
@@ -44,18 +56,35 @@ class N8nClient:
             base_url=f"{self.base_url}/api/v1",
             headers={"X-N8N-API-KEY": self.api_key},
             timeout=timeout,
+            # Negotiated via ALPN; servers without HTTP/2 keep using HTTP/1.1
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0),
         )
+        # (workflow_id, exclude_pinned_data) -> (etag, body), most recently used last
+        self._workflow_cache: OrderedDict[tuple[str, bool], tuple[str, bytes]] = OrderedDict()
+        # get_workflows_by_id and library callers may share one client across threads
+        self._workflow_cache_lock = threading.Lock()
+        # credential_type -> encoded schema; decoded per call so callers get independent dicts
+        self._schema_cache: dict[str, bytes] = {}
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self._schema_cache_dir = Path(cache_home) / "n8n-client" / "schemas"
 
     def _request(
         self,
         method: str,
         path: str,
         params: dict | None = None,
-        json: dict | None = None,
+        json: dict | list | None = None,
     ) -> dict[str, Any]:
-        response = self._client.request(method, path, params=params, json=json)
+        if json is None:
+            response = self._client.request(method, path, params=params)
+        else:
+            # Encode with orjson rather than httpx's stdlib json
+            response = self._client.request(
+                method, path, params=params, content=orjson.dumps(json), headers=JSON_CONTENT_TYPE
+            )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def _paginated_request(
         self,
@@ -100,11 +129,60 @@ class N8nClient:
         return self._paginated_request("/workflows", params, limit, cursor)
 
     def get_workflow(self, workflow_id: str, exclude_pinned_data: bool = False) -> dict[str, Any]:
-        """Retrieve a specific workflow by ID."""
+        """
+        Retrieve a specific workflow by ID.
+
+        Responses that carry an ETag are kept per client and revalidated with
+        If-None-Match, so re-reading an unchanged workflow costs a bodyless 304.
+        """
+        return orjson.loads(self.get_workflow_raw(workflow_id, exclude_pinned_data))
+
+    def get_workflow_raw(self, workflow_id: str, exclude_pinned_data: bool = False) -> bytes:
+        """Retrieve a specific workflow by ID as the undecoded JSON response body."""
         params = {}
         if exclude_pinned_data:
             params["excludePinnedData"] = True
-        return self._request("GET", f"/workflows/{workflow_id}", params=params)
+
+        key = (workflow_id, exclude_pinned_data)
+        with self._workflow_cache_lock:
+            cached = self._workflow_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._client.get(f"/workflows/{workflow_id}", params=params, headers=headers)
+
+        if response.status_code == 304 and cached:
+            # Re-insert rather than move_to_end: another thread may have evicted the key meanwhile
+            self._remember_workflow(key, cached)
+            return cached[1]
+
+        response.raise_for_status()
+        etag = response.headers.get("etag")
+        if etag:
+            self._remember_workflow(key, (etag, response.content))
+        return response.content
+
+    def _remember_workflow(self, key: tuple[str, bool], entry: tuple[str, bytes]) -> None:
+        """Store a workflow body as the most recently used cache entry, evicting the oldest beyond 32."""
+        with self._workflow_cache_lock:
+            self._workflow_cache[key] = entry
+            self._workflow_cache.move_to_end(key)
+            if len(self._workflow_cache) > 32:
+                self._workflow_cache.popitem(last=False)
+
+    def get_workflows_by_id(
+        self,
+        workflow_ids: list[str],
+        exclude_pinned_data: bool = False,
+        concurrency: int = 8,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve several workflows concurrently, returned in the order of workflow_ids.
+
+        Useful for enriching a get_workflows listing without one round-trip per workflow;
+        the requests share the client's pooled connections.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(workflow_ids)))) as pool:
+            futures = [pool.submit(self.get_workflow, workflow_id, exclude_pinned_data) for workflow_id in workflow_ids]
+            return [future.result() for future in futures]
 
     def create_workflow(self, workflow: dict[str, Any]) -> dict[str, Any]:
         """Create a new workflow."""
@@ -141,10 +219,12 @@ class N8nClient:
 
     def transfer_workflow(self, workflow_id: str, project_id: str) -> None:
         """Transfer a workflow to a different project."""
+        # The endpoint answers with an empty body, so skip _request's JSON decoding
         self._client.request(
             "PUT",
-            f"/api/v1/workflows/{workflow_id}/transfer",
-            json={"destinationProjectId": project_id},
+            f"/workflows/{workflow_id}/transfer",
+            content=orjson.dumps({"destinationProjectId": project_id}),
+            headers=JSON_CONTENT_TYPE,
         ).raise_for_status()
 
     def get_workflow_tags(self, workflow_id: str) -> list[dict[str, Any]]:
@@ -155,6 +235,34 @@ class N8nClient:
         """Update tags for a workflow."""
         return self._request("PUT", f"/workflows/{workflow_id}/tags", json=tag_ids)
 
+    def trigger_webhook(
+        self,
+        url: str,
+        method: str = "POST",
+        payload: dict[str, Any] | None = None,
+        timeout: float = 60.0,
+    ) -> httpx.Response:
+        """
+        Call a workflow webhook, reusing the API client's pooled connections.
+
+        Args:
+            url: Absolute webhook URL
+            method: HTTP method configured on the webhook node; GET sends payload as query params
+            payload: Data to send to the webhook
+            timeout: Request timeout in seconds
+        """
+        if method == "GET":
+            request = self._client.build_request("GET", url, params=payload or None, timeout=timeout)
+        elif payload is None:
+            request = self._client.build_request("POST", url, timeout=timeout)
+        else:
+            request = self._client.build_request(
+                "POST", url, content=orjson.dumps(payload), headers=JSON_CONTENT_TYPE, timeout=timeout
+            )
+        # Webhooks expose request headers to the workflow, so never forward the API key
+        request.headers.pop("X-N8N-API-KEY", None)
+        return self._client.send(request)
+
     # ==================== Executions ====================
 
     def get_executions(
@@ -190,10 +298,29 @@ class N8nClient:
 
     def get_execution(self, execution_id: str, include_data: bool = False) -> dict[str, Any]:
         """Retrieve a specific execution by ID."""
+        return orjson.loads(self.get_execution_raw(execution_id, include_data))
+
+    def get_execution_raw(self, execution_id: str, include_data: bool = False) -> bytes:
+        """Retrieve a specific execution by ID as the undecoded JSON response body."""
+        params = {}
+        if include_data:
+            params["includeData"] = True
+        response = self._client.get(f"/executions/{execution_id}", params=params)
+        response.raise_for_status()
+        return response.content
+
+    def iter_execution_raw(self, execution_id: str, include_data: bool = False):
+        """
+        Yield a specific execution's undecoded JSON response body in chunks as it downloads.
+
+        Unlike get_execution_raw, the body is never held in memory as a whole.
+        """
         params = {}
         if include_data:
             params["includeData"] = True
-        return self._request("GET", f"/executions/{execution_id}", params=params)
+        with self._client.stream("GET", f"/executions/{execution_id}", params=params) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes()
 
     def delete_execution(self, execution_id: str) -> dict[str, Any]:
         """Delete an execution."""
@@ -259,8 +386,38 @@ class N8nClient:
         return self._request("DELETE", f"/credentials/{credential_id}")
 
     def get_credential_schema(self, credential_type: str) -> dict[str, Any]:
-        """Get the schema for a credential type."""
-        return self._request("GET", f"/credentials/schema/{credential_type}")
+        """
+        Get the schema for a credential type.
+
+        Schemas are kept in memory and in $XDG_CACHE_HOME/n8n-client/schemas
+        (per instance URL) for SCHEMA_CACHE_TTL seconds, so repeated lookups
+        across runs skip the request.
+        """
+        if credential_type in self._schema_cache:
+            return orjson.loads(self._schema_cache[credential_type])
+
+        key = hashlib.blake2b(f"{self.base_url}\0{credential_type}".encode(), digest_size=16).hexdigest()
+        path = self._schema_cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime < SCHEMA_CACHE_TTL:
+                body = path.read_bytes()
+                schema = orjson.loads(body)
+                self._schema_cache[credential_type] = body
+                return schema
+        except (OSError, orjson.JSONDecodeError):
+            pass
+
+        schema = self._request("GET", f"/credentials/schema/{credential_type}")
+        body = self._schema_cache[credential_type] = orjson.dumps(schema)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent runs never read a partial file
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        return schema
 
     # ==================== Users ====================
 
@@ -313,11 +470,45 @@ class N8nClient:
 
     # ==================== Utilities ====================
 
+    def iter_pages(
+        self,
+        method,
+        *args,
+        max_pages: int = 100,
+        stop_after: int | None = None,
+        **kwargs,
+    ):
+        """
+        Yield the items of each page from a paginated endpoint.
+
+        The next page is requested in the background as soon as its cursor
+        is known, so it downloads while the caller handles the current page.
+
+        Args:
+            method: The paginated method to call (e.g., client.get_workflows)
+            max_pages: Maximum number of pages to fetch (safety limit)
+            stop_after: Stop requesting pages once this many items have been yielded
+            *args, **kwargs: Arguments to pass to the method
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            result = method(*args, cursor=None, **kwargs)
+            seen = 0
+            for page in range(1, max_pages + 1):
+                seen += len(result.data)
+                pending = None
+                if result.next_cursor and page < max_pages and (stop_after is None or seen < stop_after):
+                    pending = pool.submit(method, *args, cursor=result.next_cursor, **kwargs)
+                yield result.data
+                if pending is None:
+                    break
+                result = pending.result()
+
     def get_all_pages(
         self,
         method,
         *args,
         max_pages: int = 100,
+        stop_after: int | None = None,
         **kwargs,
     ) -> list[dict[str, Any]]:
         """
@@ -326,23 +517,48 @@ class N8nClient:
         Args:
             method: The paginated method to call (e.g., client.get_workflows)
             max_pages: Maximum number of pages to fetch (safety limit)
+            stop_after: Return at most this many items, without fetching further pages
             *args, **kwargs: Arguments to pass to the method
 
         Returns:
             Combined list of all items from all pages
         """
         all_data = []
-        cursor = None
+        for data in self.iter_pages(method, *args, max_pages=max_pages, stop_after=stop_after, **kwargs):
+            all_data.extend(data)
+        if stop_after is not None:
+            del all_data[stop_after:]
+        return all_data
+
+    def get_all_pages_many(
+        self,
+        method,
+        queries: list[dict[str, Any]],
+        concurrency: int = 8,
+        max_pages: int = 100,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Fetch all pages for several independent queries concurrently.
 
-        for _ in range(max_pages):
-            result = method(*args, cursor=cursor, **kwargs)
-            all_data.extend(result.data)
+        Each cursor chain is still walked in order, but separate queries
+        (e.g. executions for several workflows) run side by side over the
+        pooled connections.
 
-            if not result.next_cursor:
-                break
-            cursor = result.next_cursor
+        Args:
+            method: The paginated method to call (e.g., client.get_executions)
+            queries: Keyword arguments for each query
+            concurrency: Maximum number of queries in flight at once
+            max_pages: Maximum number of pages to fetch per query
 
-        return all_data
+        Returns:
+            One combined item list per query, in the same order as queries
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(queries)))) as pool:
+            futures = [
+                pool.submit(self.get_all_pages, method, max_pages=max_pages, **query)
+                for query in queries
+            ]
+            return [future.result() for future in futures]
 
     def close(self):
         """Close the HTTP client."""
@@ -0,0 +1,25 @@
+import httpx
+import pytest
+
+from n8n_client import N8nClient
+
+
+@pytest.fixture
+def make_client():
+    """Build N8nClients whose requests go to a MockTransport handler."""
+    clients = []
+
+    def make(handler) -> N8nClient:
+        client = N8nClient(api_key="key", base_url="https://n8n.example.com")
+        client._client.close()
+        client._client = httpx.Client(
+            base_url="https://n8n.example.com/api/v1",
+            headers={"X-N8N-API-KEY": "key"},
+            transport=httpx.MockTransport(handler),
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
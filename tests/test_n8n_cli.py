@@ -0,0 +1,89 @@
+import argparse
+import contextlib
+import io
+
+import httpx
+import orjson
+import pytest
+
+import n8n_cli
+
+WORKFLOW = {
+    "id": "w1",
+    "name": "Flow",
+    "nodes": [
+        {"id": "a", "name": "Code A", "type": "n8n-nodes-base.code", "parameters": {"jsCode": "return 1;"}},
+        {"id": "b", "name": "Agent", "type": "n8n-nodes-base.agent", "parameters": {"options": {"x": 1}}},
+    ],
+    "connections": {},
+    "settings": {},
+}
+
+
+@pytest.fixture
+def workflow_server(make_client):
+    """Client backed by a mock serving WORKFLOW, plus the list of requests it received."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json=WORKFLOW)
+        return httpx.Response(200, content=request.content)
+
+    return make_client(handler), requests
+
+
+def run_batch(client, tmp_path, script):
+    path = tmp_path / "edits.json"
+    path.write_bytes(orjson.dumps(script))
+    n8n_cli.cmd_batch(client, argparse.Namespace(id="w1", script=str(path)))
+
+
+def test_batch_applies_set_and_merge_in_one_update(workflow_server, tmp_path):
+    client, requests = workflow_server
+    run_batch(client, tmp_path, [
+        {"node": "Code A", "set": {"options.mode": "each"}},
+        {"node": "Agent", "merge": {"options": {"y": 2}}},
+    ])
+
+    assert [r.method for r in requests] == ["GET", "PUT"]
+    nodes = n8n_cli.index_nodes(orjson.loads(requests[1].content)["nodes"])
+    assert nodes["Code A"]["parameters"] == {"jsCode": "return 1;", "options": {"mode": "each"}}
+    assert nodes["Agent"]["parameters"] == {"options": {"x": 1, "y": 2}}
+
+
+def test_batch_unknown_node_sends_no_update(workflow_server, tmp_path):
+    client, requests = workflow_server
+    with pytest.raises(SystemExit):
+        run_batch(client, tmp_path, [{"node": "Code A", "set": {"a": 1}}, {"node": "Missing", "set": {"a": 1}}])
+    assert [r.method for r in requests] == ["GET"]
+
+
+@pytest.mark.parametrize("script", [
+    [{"node": "Code A", "set": [1]}],
+    [{"node": "Code A", "merge": "x"}],
+    [{"node": "Code A", "sett": {"a": 1}}],
+    [{"set": {"a": 1}}],
+])
+def test_batch_rejects_malformed_edits(workflow_server, tmp_path, script):
+    client, requests = workflow_server
+    with pytest.raises(SystemExit):
+        run_batch(client, tmp_path, script)
+    assert requests == []
+
+
+def test_batch_empty_script_sends_nothing(workflow_server, tmp_path, capsys):
+    client, requests = workflow_server
+    run_batch(client, tmp_path, [])
+    assert requests == []
+    assert "No edits to apply." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("size", [10, n8n_cli.LARGE_OUTPUT_BYTES * 2])
+def test_print_json_to_text_only_stdout(size):
+    data = {"x": "é" * size}
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        n8n_cli.print_json(data, compact=True)
+    assert out.getvalue() == orjson.dumps(data).decode() + "\n"
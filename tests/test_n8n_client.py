@@ -0,0 +1,111 @@
+import time
+
+import httpx
+import pytest
+
+
+def test_get_workflows_by_id_shares_etag_cache_across_threads(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        workflow_id = request.url.path.rsplit("/", 1)[-1]
+        etag = f'"{workflow_id}"'
+        # Give other threads a chance to evict entries between lookup and store
+        time.sleep(0.001)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": workflow_id}, headers={"ETag": etag})
+
+    client = make_client(handler)
+    # More IDs than the cache holds, so revalidated entries race with evictions
+    workflow_ids = [str(i) for i in range(40)]
+    for _ in range(5):
+        workflows = client.get_workflows_by_id(workflow_ids)
+        assert [w["id"] for w in workflows] == workflow_ids
+    assert len(client._workflow_cache) == 32
+
+
+def test_get_credential_schema_returns_independent_dicts(make_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"properties": [{"name": "value"}]})
+
+    client = make_client(handler)
+    client.get_credential_schema("x")["properties"].append({"name": "extra"})
+    assert client.get_credential_schema("x") == {"properties": [{"name": "value"}]}
+
+    # A new client reads the same schema back from disk
+    other = make_client(handler)
+    other.get_credential_schema("x")["properties"].clear()
+    assert other.get_credential_schema("x") == {"properties": [{"name": "value"}]}
+    assert len(requests) == 1
+
+
+def test_trigger_webhook_does_not_forward_api_key(make_client):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    client = make_client(handler)
+    client.trigger_webhook("https://n8n.example.com/webhook/a", payload={"x": 1})
+    client.trigger_webhook("https://n8n.example.com/webhook/a", method="GET")
+    assert [r.method for r in requests] == ["POST", "GET"]
+    assert all("X-N8N-API-KEY" not in r.headers for r in requests)
+
+
+def endless_pages(requests, fail_on_page=None):
+    """Serve an unbounded cursor chain of two-item pages, recording each request."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params.get("cursor", "0"))
+        if page == fail_on_page:
+            return httpx.Response(500)
+        prefix = request.url.params.get("workflowId", "wf")
+        data = [{"id": f"{prefix}-{page}-{i}"} for i in range(2)]
+        return httpx.Response(200, json={"data": data, "nextCursor": str(page + 1)})
+
+    return handler
+
+
+def test_iter_pages_fetches_at_most_max_pages(make_client):
+    requests = []
+    client = make_client(endless_pages(requests))
+    pages = list(client.iter_pages(client.get_workflows, max_pages=3))
+    assert len(pages) == 3
+    assert len(requests) == 3
+
+
+def test_get_all_pages_stop_after_stops_requests_and_trims(make_client):
+    requests = []
+    client = make_client(endless_pages(requests))
+    items = client.get_all_pages(client.get_workflows, stop_after=3)
+    assert [item["id"] for item in items] == ["wf-0-0", "wf-0-1", "wf-1-0"]
+    # The second page covers stop_after, so nothing further is prefetched
+    assert [r.url.params.get("cursor") for r in requests] == [None, "1"]
+
+
+def test_iter_pages_raises_prefetched_page_error(make_client):
+    requests = []
+    client = make_client(endless_pages(requests, fail_on_page=2))
+    pages = client.iter_pages(client.get_workflows)
+    assert len(next(pages)) == 2
+    assert len(next(pages)) == 2
+    with pytest.raises(httpx.HTTPStatusError):
+        next(pages)
+    assert len(requests) == 3
+
+
+def test_get_all_pages_many_keeps_query_order(make_client):
+    requests = []
+    client = make_client(endless_pages(requests))
+    queries = [{"workflow_id": str(i)} for i in range(5)]
+    results = client.get_all_pages_many(client.get_executions, queries, concurrency=3, max_pages=2)
+    assert [[item["id"] for item in items] for items in results] == [
+        [f"{i}-0-0", f"{i}-0-1", f"{i}-1-0", f"{i}-1-1"] for i in range(5)
+    ]
+    # max_pages applies to each query, not to the batch as a whole
+    assert len(requests) == 10